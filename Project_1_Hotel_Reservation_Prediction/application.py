@@ -1,13 +1,13 @@
-import joblib
 import numpy as np
-from config.paths_config import MODEL_OUTPUT_DIR
+from config.paths_config import INFERENCE_MODEL_PATH
 from flask import Flask, render_template, request
+from src.inference import InferenceModel
 
 app = Flask(__name__)
 
-# Load model
+# Load the slim inference artifact (numpy only, no xgboost/sklearn needed)
 try:
-    loaded_model = joblib.load(f"{MODEL_OUTPUT_DIR}/xgboost_model.joblib")
+    loaded_model = InferenceModel(INFERENCE_MODEL_PATH)
 except Exception as e:
     loaded_model = None
     print(f"Error loading model: {e}")
@@ -15,3 +15,7 @@ PROCESSED_TEST_FILE_PATH = os.path.join(PROCESSED_DIR, "Hotel_Reservations_test_
 
 # Model Training
 MODEL_OUTPUT_DIR = "artifacts/models/xgboost"
+MODEL_OUTPUT_PATH = os.path.join(MODEL_OUTPUT_DIR, "xgboost_model.joblib")
+
+# Serving
+INFERENCE_MODEL_PATH = os.path.join(MODEL_OUTPUT_DIR, "xgboost_inference.npz")
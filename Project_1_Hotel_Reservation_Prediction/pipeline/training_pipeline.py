@@ -1,19 +1,22 @@
-import os
-
-from src.data_ingestion import DataIngestion
-from src.data_preprocessing import DataProcessor
-from src.model_training import ModelTraining
 from utils.common_fucntions import read_yaml_file
 from config.paths_config import *
 
 
 def main():
-    """Main function to run the training pipeline."""
+    """Main function to run the training pipeline.
+
+    Each stage is imported right before it runs so it only loads the
+    libraries it needs.
+    """
     # 1: Data Ingestion
+    from src.data_ingestion import DataIngestion
+
     data_ingestion = DataIngestion(read_yaml_file(CONFIG_PATH))
     data_ingestion.run()
 
     # 2: Data Processing
+    from src.data_preprocessing import DataProcessor
+
     processor = DataProcessor(
         train_path=TRAIN_FILE_PATH,
         test_path=TEST_FILE_PATH,
@@ -23,13 +26,25 @@ def main():
     processor.process()
 
     # 3: Model Training
+    from src.model_training import ModelTraining
+
     model_trainer = ModelTraining(
         train_path=PROCESSED_TRAIN_FILE_PATH,
         test_path=PROCESSED_TEST_FILE_PATH,
-        model_output_path=os.path.join(MODEL_OUTPUT_DIR, "xgboost_model.joblib"),
+        model_output_path=MODEL_OUTPUT_PATH,
     )
     model_trainer.run()
 
+    # 4: Inference Artifact Export
+    from src.model_export import InferenceExporter
+
+    exporter = InferenceExporter(
+        model_path=MODEL_OUTPUT_PATH,
+        inference_model_path=INFERENCE_MODEL_PATH,
+        test_path=PROCESSED_TEST_FILE_PATH,
+    )
+    exporter.run()
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
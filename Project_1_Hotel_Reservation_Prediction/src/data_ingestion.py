@@ -1,6 +1,5 @@
 import os
 import pandas as pd
-from google.cloud import storage
 from sklearn.model_selection import train_test_split
 from src.logger import get_logger
 from src.custom_exception import CustomException
@@ -29,6 +28,9 @@ class DataIngestion:
     def download_data(self) -> None:
         """Download data from GCS bucket."""
         try:
+            # Imported here so stages that never touch GCS skip the client library
+            from google.cloud import storage
+
             client = storage.Client()
             bucket = client.bucket(self.bucket_name)
             blob = bucket.blob(self.bucket_file_name)
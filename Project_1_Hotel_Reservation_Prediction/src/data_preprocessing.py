@@ -5,7 +5,6 @@ from src.logger import get_logger
 from src.custom_exception import CustomException
 from config.paths_config import *
 from utils.common_fucntions import load_data, read_yaml_file
-from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from imblearn.over_sampling import SMOTE
 
@@ -97,6 +96,8 @@ class DataProcessor:
     def select_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """Select important features using RandomForest feature importance."""
         try:
+            from sklearn.ensemble import RandomForestClassifier
+
             logger.info("Starting feature selection using RandomForestClassifier")
             X = df.drop(columns=["booking_status"])
             y = df["booking_status"]
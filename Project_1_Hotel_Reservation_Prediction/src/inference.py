@@ -0,0 +1,70 @@
+import numpy as np
+from src.logger import get_logger
+from src.custom_exception import CustomException
+
+logger = get_logger(__name__)
+
+
+class InferenceModel:
+    """Slim XGBoost predictor that only needs numpy to score requests.
+
+    The tree ensemble is loaded from the flat arrays written by
+    `src.model_export.InferenceExporter`, so serving never imports xgboost,
+    scikit-learn, scipy or mlflow.
+    """
+
+    def __init__(self, artifact_path: str) -> None:
+        try:
+            with np.load(artifact_path, allow_pickle=False) as artifact:
+                self.left = artifact["left"]
+                self.right = artifact["right"]
+                self.feature = artifact["feature"]
+                self.threshold = artifact["threshold"]
+                self.default_left = artifact["default_left"]
+                self.leaf_value = artifact["leaf_value"]
+                self.base_margin = np.float32(artifact["base_margin"])
+                self.max_depth = int(artifact["max_depth"])
+                self.feature_names = artifact["feature_names"].tolist()
+            self.tree_index = np.arange(self.left.shape[0])
+            logger.info(
+                "Inference model loaded from %s with %d trees",
+                artifact_path,
+                self.left.shape[0],
+            )
+        except Exception as e:
+            logger.error("Error loading inference model from %s: %s", artifact_path, str(e))
+            raise CustomException("Error loading inference model", e)
+
+    def predict_margin(self, X) -> np.ndarray:
+        """Return the raw (logit) score for each row of X."""
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        rows = np.arange(X.shape[0])[:, None]
+        node = np.zeros((X.shape[0], self.tree_index.shape[0]), dtype=np.int32)
+        # Walk every tree one level per step; leaves point back to themselves.
+        for _ in range(self.max_depth):
+            values = X[rows, self.feature[self.tree_index, node]]
+            go_left = np.where(
+                np.isnan(values),
+                self.default_left[self.tree_index, node],
+                values < self.threshold[self.tree_index, node],
+            )
+            node = np.where(
+                go_left,
+                self.left[self.tree_index, node],
+                self.right[self.tree_index, node],
+            )
+
+        leaves = self.leaf_value[self.tree_index, node]
+        return leaves.sum(axis=1, dtype=np.float32) + self.base_margin
+
+    def predict_proba(self, X) -> np.ndarray:
+        """Return class probabilities with the same layout as XGBClassifier."""
+        positive = 1.0 / (1.0 + np.exp(-self.predict_margin(X)))
+        return np.column_stack([1.0 - positive, positive])
+
+    def predict(self, X) -> np.ndarray:
+        """Return the predicted class (0 or 1) for each row of X."""
+        return (self.predict_margin(X) > 0).astype(np.int64)
@@ -0,0 +1,149 @@
+import os
+import json
+
+import numpy as np
+import joblib
+
+from src.logger import get_logger
+from src.custom_exception import CustomException
+from src.inference import InferenceModel
+from config.paths_config import *
+from utils.common_fucntions import load_data
+
+logger = get_logger(__name__)
+
+
+class InferenceExporter:
+    """Class for converting the trained XGBoost model into a slim inference artifact."""
+
+    def __init__(self, model_path: str, inference_model_path: str, test_path: str) -> None:
+        self.model_path = model_path
+        self.inference_model_path = inference_model_path
+        self.test_path = test_path
+
+        if not os.path.exists(os.path.dirname(self.inference_model_path)):
+            os.makedirs(os.path.dirname(self.inference_model_path))
+
+    def load_booster_json(self) -> dict:
+        """Load the trained model and return its booster as a JSON document."""
+        try:
+            logger.info("Loading trained model from %s", self.model_path)
+            model = joblib.load(self.model_path)
+            booster_json = json.loads(bytes(model.get_booster().save_raw(raw_format="json")))
+            return booster_json
+        except Exception as e:
+            logger.error("Error loading trained model: %s", str(e))
+            raise CustomException("Error loading trained model", e)
+
+    @staticmethod
+    def _tree_depth(left: list, right: list) -> int:
+        """Return the depth of a tree given its child index arrays."""
+        depth, frontier = 0, [0]
+        while True:
+            frontier = [child for n in frontier for child in (left[n], right[n]) if child != -1]
+            if not frontier:
+                return depth
+            depth += 1
+
+    def flatten_trees(self, booster_json: dict) -> dict:
+        """Pad every tree into fixed-size arrays that numpy can traverse in parallel."""
+        try:
+            learner = booster_json["learner"]
+            booster = learner["gradient_booster"]
+            if booster["name"] != "gbtree":
+                raise ValueError(f"Unsupported booster type: {booster['name']}")
+
+            trees = booster["model"]["trees"]
+            max_nodes = max(len(tree["left_children"]) for tree in trees)
+            shape = (len(trees), max_nodes)
+
+            left = np.zeros(shape, dtype=np.int32)
+            right = np.zeros(shape, dtype=np.int32)
+            feature = np.zeros(shape, dtype=np.int32)
+            threshold = np.zeros(shape, dtype=np.float32)
+            default_left = np.zeros(shape, dtype=bool)
+            leaf_value = np.zeros(shape, dtype=np.float32)
+            max_depth = 0
+
+            for t, tree in enumerate(trees):
+                n = len(tree["left_children"])
+                is_leaf = np.asarray(tree["left_children"]) == -1
+                nodes = np.arange(n)
+
+                # Leaves loop back to themselves so traversal can run a fixed number of steps
+                left[t, :n] = np.where(is_leaf, nodes, tree["left_children"])
+                right[t, :n] = np.where(is_leaf, nodes, tree["right_children"])
+                feature[t, :n] = np.where(is_leaf, 0, tree["split_indices"])
+                threshold[t, :n] = np.where(is_leaf, 0, tree["split_conditions"])
+                default_left[t, :n] = np.asarray(tree["default_left"], dtype=bool)
+                # For leaf nodes XGBoost stores the leaf weight in split_conditions
+                leaf_value[t, :n] = np.where(is_leaf, tree["split_conditions"], 0)
+
+                max_depth = max(max_depth, self._tree_depth(tree["left_children"], tree["right_children"]))
+
+            base_score = float(str(learner["learner_model_param"]["base_score"]).strip("[]"))
+            base_margin = np.float32(np.log(base_score / (1.0 - base_score)))
+
+            logger.info("Flattened %d trees, max depth %d, max nodes %d", len(trees), max_depth, max_nodes)
+            return {
+                "left": left,
+                "right": right,
+                "feature": feature,
+                "threshold": threshold,
+                "default_left": default_left,
+                "leaf_value": leaf_value,
+                "base_margin": base_margin,
+                "max_depth": np.int32(max_depth),
+                "feature_names": np.asarray(learner.get("feature_names", []), dtype=str),
+            }
+        except Exception as e:
+            logger.error("Error flattening model trees: %s", str(e))
+            raise CustomException("Error flattening model trees", e)
+
+    def save_artifact(self, arrays: dict) -> None:
+        """Save the flattened trees as a compressed numpy archive."""
+        try:
+            np.savez_compressed(self.inference_model_path, **arrays)
+            logger.info("Inference artifact saved to %s", self.inference_model_path)
+        except Exception as e:
+            logger.error("Error saving inference artifact: %s", str(e))
+            raise CustomException("Error saving inference artifact", e)
+
+    def verify_artifact(self) -> None:
+        """Check the slim model reproduces the trained model's predictions on the test set."""
+        try:
+            logger.info("Verifying inference artifact against the trained model")
+            model = joblib.load(self.model_path)
+            X_test = load_data(self.test_path).drop("booking_status", axis=1)
+
+            expected = model.predict_proba(X_test)[:, 1]
+            actual = InferenceModel(self.inference_model_path).predict_proba(X_test.to_numpy())[:, 1]
+
+            if not np.allclose(expected, actual, atol=1e-5):
+                max_diff = float(np.max(np.abs(expected - actual)))
+                raise ValueError(f"Inference artifact disagrees with trained model (max diff {max_diff})")
+            logger.info("Inference artifact verified on %d test rows", len(X_test))
+        except Exception as e:
+            logger.error("Error verifying inference artifact: %s", str(e))
+            raise CustomException("Error verifying inference artifact", e)
+
+    def run(self) -> None:
+        """Run the full inference artifact export."""
+        try:
+            logger.info("Starting inference artifact export")
+            booster_json = self.load_booster_json()
+            self.save_artifact(self.flatten_trees(booster_json))
+            self.verify_artifact()
+            logger.info("Inference artifact export completed successfully")
+        except Exception as e:
+            logger.error("Error in inference artifact export: %s", str(e))
+            raise CustomException("Error in inference artifact export", e)
+
+
+if __name__ == "__main__":
+    exporter = InferenceExporter(
+        model_path=MODEL_OUTPUT_PATH,
+        inference_model_path=INFERENCE_MODEL_PATH,
+        test_path=PROCESSED_TEST_FILE_PATH,
+    )
+    exporter.run()
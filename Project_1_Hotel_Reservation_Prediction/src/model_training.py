@@ -1,24 +1,8 @@
 import os
 
-import pandas as pd
-import joblib
-from scipy.stats import randint
-from sklearn.metrics import (
-    f1_score,
-    accuracy_score,
-    recall_score,
-    precision_score,
-)
-from sklearn.model_selection import RandomizedSearchCV
-from xgboost import XGBClassifier
-
-import mlflow
-import mlflow.sklearn
-
 from src.logger import get_logger
 from src.custom_exception import CustomException
 from config.paths_config import *
-from config.model_params import *
 from utils.common_fucntions import load_data, read_yaml_file
 
 logger = get_logger(__name__)
@@ -35,6 +19,9 @@ class ModelTraining:
         if not os.path.exists(os.path.dirname(self.model_output_path)):
             os.makedirs(os.path.dirname(self.model_output_path))
 
+        # model_params pulls in scipy, so load it only when a trainer is created
+        from config.model_params import XGBOOST_PARAMS, RANDOM_SEARCH_PARAMS
+
         self.params_distribution = XGBOOST_PARAMS
         self.random_search_params = RANDOM_SEARCH_PARAMS
 
@@ -61,6 +48,9 @@ class ModelTraining:
     def train_model(self, X_train, y_train):
         """Train XGBoost model with RandomizedSearchCV."""
         try:
+            from sklearn.model_selection import RandomizedSearchCV
+            from xgboost import XGBClassifier
+
             logger.info("Starting model training with RandomizedSearchCV")
             xgb = XGBClassifier(
                 objective="binary:logistic",
@@ -96,6 +86,8 @@ class ModelTraining:
     def evaluate_model(self, model, X_test, y_test):
         """Evaluate the trained model on test data."""
         try:
+            from sklearn.metrics import f1_score, accuracy_score, recall_score, precision_score
+
             logger.info("Evaluating the trained model")
             y_pred = model.predict(X_test)
 
@@ -122,6 +114,8 @@ class ModelTraining:
     def save_model(self, model):
         """Save the trained model to disk."""
         try:
+            import joblib
+
             logger.info("Saving the trained model to %s", self.model_output_path)
             joblib.dump(model, self.model_output_path)
             logger.info("Model saved successfully")
@@ -132,6 +126,8 @@ class ModelTraining:
     def run(self):
         """Run the full model training pipeline."""
         try:
+            import mlflow
+
             with mlflow.start_run():
                 logger.info("Starting model training pipeline")
                 logger.info("MLflow run ID started")
@@ -163,6 +159,6 @@ if __name__ == "__main__":
     model_trainer = ModelTraining(
         train_path=PROCESSED_TRAIN_FILE_PATH,
         test_path=PROCESSED_TEST_FILE_PATH,
-        model_output_path=os.path.join(MODEL_OUTPUT_DIR, "xgboost_model.joblib"),
+        model_output_path=MODEL_OUTPUT_PATH,
     )
     model_trainer.run()
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""Measure import time and time-to-first-prediction for serving and each pipeline stage.
+
+Every measurement runs in a fresh interpreter so module caches from one
+target never hide the cost of another. Run from the project root:
+
+    python startup_report.py [--repeats 5]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+from config.paths_config import MODEL_OUTPUT_PATH, INFERENCE_MODEL_PATH
+
+HEAVY_MODULES = ["pandas", "sklearn", "scipy", "xgboost", "mlflow", "imblearn", "joblib", "google.cloud.storage"]
+
+IMPORT_TARGETS = [
+    "application",
+    "src.inference",
+    "pipeline.training_pipeline",
+    "src.data_ingestion",
+    "src.data_preprocessing",
+    "src.model_training",
+    "src.model_export",
+]
+
+SAMPLE_FORM = {
+    "lead_time": "45",
+    "no_of_special_requests": "1",
+    "avg_price_per_room": "99.5",
+    "arrival_month": "7",
+    "arrival_date": "14",
+    "no_of_week_nights": "2",
+    "market_segment_type": "1",
+    "no_of_weekend_nights": "1",
+    "arrival_year": "2018",
+    "no_of_adults": "2",
+}
+
+IMPORT_SNIPPET = """
+import sys, json, time, importlib
+start = time.perf_counter()
+importlib.import_module({target!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+SERVING_SNIPPET = """
+import sys, json, time
+start = time.perf_counter()
+import application
+loaded = time.perf_counter()
+response = application.app.test_client().post("/", data={form!r})
+assert b"Customer is" in response.data, "model did not produce a prediction"
+done = time.perf_counter()
+print(json.dumps({{"import": loaded - start, "first_prediction": done - start,
+                   "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+LEGACY_SNIPPET = """
+import sys, json, time
+start = time.perf_counter()
+import joblib
+import numpy as np
+model = joblib.load({model_path!r})
+loaded = time.perf_counter()
+model.predict(np.array([[{row}]]))
+done = time.perf_counter()
+print(json.dumps({{"import": loaded - start, "first_prediction": done - start,
+                   "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def run_snippet(code: str) -> dict:
+    """Run a snippet in a fresh interpreter and return its JSON output plus process wall time."""
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "snippet failed")
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    data["process"] = wall
+    return data
+
+
+def measure(code: str, repeats: int) -> dict:
+    """Run a snippet several times and keep the median of every timing."""
+    runs = [run_snippet(code) for _ in range(repeats)]
+    summary = {key: statistics.median(run[key] for run in runs) for key in runs[0] if key != "loaded"}
+    summary["loaded"] = runs[0]["loaded"]
+    return summary
+
+
+def ms(seconds: float) -> str:
+    return f"{seconds * 1000:8.1f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5, help="fresh-interpreter runs per measurement")
+    args = parser.parse_args()
+
+    print(f"Import time (median of {args.repeats} fresh interpreters)\n")
+    print(f"{'module':<30}{'import':>12}{'process':>12}  heavy modules loaded")
+    for target in IMPORT_TARGETS:
+        try:
+            result = measure(IMPORT_SNIPPET.format(target=target, heavy=HEAVY_MODULES), args.repeats)
+            loaded = ", ".join(result["loaded"]) or "-"
+            print(f"{target:<30}{ms(result['seconds']):>12}{ms(result['process']):>12}  {loaded}")
+        except RuntimeError as e:
+            print(f"{target:<30}{'n/a':>12}{'n/a':>12}  {e}")
+
+    print("\nTime to first prediction (from interpreter start of the serving code)\n")
+    print(f"{'serving path':<30}{'load':>12}{'first pred':>12}{'process':>12}  heavy modules loaded")
+    scenarios = []
+    if os.path.exists(INFERENCE_MODEL_PATH):
+        scenarios.append(("slim artifact (application)", SERVING_SNIPPET.format(form=SAMPLE_FORM, heavy=HEAVY_MODULES)))
+    if os.path.exists(MODEL_OUTPUT_PATH):
+        row = ", ".join(SAMPLE_FORM.values())
+        scenarios.append(("joblib model (legacy)", LEGACY_SNIPPET.format(model_path=MODEL_OUTPUT_PATH, row=row, heavy=HEAVY_MODULES)))
+    if not scenarios:
+        print("No model artifacts found; run pipeline/training_pipeline.py first.")
+    for name, code in scenarios:
+        try:
+            result = measure(code, args.repeats)
+            loaded = ", ".join(result["loaded"]) or "-"
+            print(f"{name:<30}{ms(result['import']):>12}{ms(result['first_prediction']):>12}{ms(result['process']):>12}  {loaded}")
+        except RuntimeError as e:
+            print(f"{name:<30}{'n/a':>12}{'n/a':>12}{'n/a':>12}  {e}")
+
+
+if __name__ == "__main__":
+    main()